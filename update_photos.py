@@ -13,33 +13,103 @@ Features:
 """
 
 import os
+import atexit
 import json
 import subprocess
 import datetime
+import functools
 import shutil
 import unicodedata
 import re
 import sys
-from pathlib import Path
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # ===== CONFIG =====
 ROOT_DIR = "/Users/bernatcucarella/Downloads/old_GooglePhotos_25.10.02/other"  # <-- adjust this path
 BAR_LENGTH = 40
+PROGRESS_UPDATES = 500  # max progress bar redraws per run
 PHOTO_EXTS = (".jpg", ".jpeg", ".png", ".heic", ".tiff", ".gif")
 VIDEO_EXTS = (".mp4", ".mov", ".mkv", ".avi", ".wmv")
 ALL_EXTS = PHOTO_EXTS + VIDEO_EXTS
+_VIDEO_EXTS_SET = frozenset(VIDEO_EXTS)
+_ALL_EXTS_SET = frozenset(ALL_EXTS)
+
+# exiftool date tag prefixes written per extension, completed with the date
+_BASE_DATE_TAGS = ("-FileModifyDate=", "-FileCreateDate=")
+_PHOTO_DATE_TAGS = _BASE_DATE_TAGS + ("-AllDates=",)
+_VIDEO_DATE_TAGS = _BASE_DATE_TAGS + ("-Keys:CreationDate=", "-QuickTime:CreateDate=", "-QuickTime:ModifyDate=")
+_EXT_DATE_TAGS = {
+    **{ext: _PHOTO_DATE_TAGS for ext in PHOTO_EXTS},
+    **{ext: _VIDEO_DATE_TAGS for ext in VIDEO_EXTS},
+}
+BACKUP_DIR_NAME = ".json_backup"
+
+
+_SUFFIX_RE = re.compile(r"\s*\(\d+\)\s*$")
+
+# Takeout timestamp keys, by priority, and patterns matching
+# '"key": {..., "timestamp": "123", ...}' in a sidecar's raw bytes
+# (other value shapes are left to the full parse)
+_TIMESTAMP_KEYS = ("contentCreateTime", "photoTakenTime", "creationTime")
+_TIMESTAMP_RES = tuple(
+    (b'"%s"' % key.encode(),
+     re.compile(rb'"%s"\s*:\s*\{[^{}]*?"timestamp"\s*:\s*"(-?\d+)"\s*[,}]' % key.encode()))
+    for key in _TIMESTAMP_KEYS
+)
 
 
 # ===== UTILITIES =====
 
+@functools.lru_cache(maxsize=16384)
 def normalize_str(s: str) -> str:
     """Normalize a string (casefold and NFC)."""
     return unicodedata.normalize("NFC", s).casefold()
 
 
+def file_ext(name: str) -> str:
+    """Return the lowercased extension of a file name or path, with the dot."""
+    i = name.rfind(".")
+    return name[i:].lower() if i >= 0 else ""
+
+
 def strip_suffix(s: str) -> str:
     """Remove suffixes like '(1)', '(2)' before the extension."""
-    return re.sub(r"\s*\(\d+\)\s*$", "", s)
+    return _SUFFIX_RE.sub("", s)
+
+
+def walk_files(top):
+    """
+    Recursively yield (dirpath, entries) with the non-directory DirEntry
+    objects of each directory, skipping `.json_backup` folders.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+
+    subdirs = []
+    files = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry)
+        elif entry.name != BACKUP_DIR_NAME and not entry.is_symlink():
+            subdirs.append(entry.path)
+
+    yield top, files
+    for path in subdirs:
+        yield from walk_files(path)
 
 
 def print_progress(current, total, fname=""):
@@ -49,13 +119,14 @@ def print_progress(current, total, fname=""):
     percent = current / total
     filled = int(BAR_LENGTH * percent)
     bar = "#" * filled + "-" * (BAR_LENGTH - filled)
-    print(f"\r[{bar}] {percent * 100:5.1f}% {fname[:50]}", end="", flush=True)
+    sys.stdout.write(f"\r[{bar}] {percent * 100:5.1f}% {fname[:50]}")
+    sys.stdout.flush()
 
 
 def exiftool_available() -> bool:
     """Check if exiftool is available in the PATH."""
     try:
-        subprocess.run(["exiftool", "-ver"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        subprocess.run(["exiftool", "-ver"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         return True
     except FileNotFoundError:
         return False
@@ -63,38 +134,224 @@ def exiftool_available() -> bool:
         return True
 
 
+# Persistent exiftool process (-stay_open), started by exiftool_start()
+_exiftool_proc = None
+
+
+def exiftool_start():
+    """Start a persistent exiftool process reading arguments from stdin."""
+    global _exiftool_proc
+    if _exiftool_proc is not None:
+        return
+    _exiftool_proc = subprocess.Popen(
+        ["exiftool", "-stay_open", "True", "-@", "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=-1,
+    )
+    atexit.unregister(exiftool_stop)
+    atexit.register(exiftool_stop)
+
+
+def exiftool_stop():
+    """Ask the persistent exiftool process to exit."""
+    global _exiftool_proc
+    proc, _exiftool_proc = _exiftool_proc, None
+    if proc is None:
+        return
+    try:
+        proc.stdin.write(b"-stay_open\nFalse\n")
+        proc.stdin.close()
+        proc.wait(timeout=10)
+    except Exception:
+        proc.kill()
+
+
+def _read_until_ready(stream):
+    """Read raw lines from a pipe until the `{ready}` sentinel."""
+    lines = []
+    while True:
+        line = stream.readline()
+        if not line:
+            raise RuntimeError("exiftool exited unexpectedly")
+        if line.rstrip(b"\r\n") == b"{ready}":
+            return b"".join(lines)
+        lines.append(line)
+
+
+def _decode(data):
+    """Decode exiftool output bytes."""
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+def _exiftool_discard():
+    """Kill the persistent exiftool process after a failure."""
+    global _exiftool_proc
+    proc, _exiftool_proc = _exiftool_proc, None
+    if proc is None:
+        return
+    try:
+        proc.kill()
+        proc.wait(timeout=10)
+    except Exception:
+        pass
+
+
+def _exiftool_run_once(args, capture_stdout, capture_stderr):
+    """Run one command in a new exiftool process; output is raw bytes."""
+    res = subprocess.run(
+        ["exiftool"] + args,
+        stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+        stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+        bufsize=-1,
+        check=False,
+    )
+    return res.returncode, res.stdout, res.stderr
+
+
+def _argfile_safe(arg):
+    """
+    Whether an argument survives exiftool's argfile parsing unchanged
+    (one per line, surrounding whitespace stripped, blank and '#' lines
+    skipped).
+    """
+    if not arg or arg[0] == "#" or arg[0].isspace() or arg[-1].isspace():
+        return False
+    return "\n" not in arg and "\r" not in arg
+
+
+# exiftool's write summary, e.g. "    1 image files updated"
+_WRITE_SUMMARY_RE = re.compile(rb"^\s*[1-9]\d* (?:image )?files? (?:updated|unchanged|created)", re.MULTILINE)
+
+
+def _exiftool_run_persistent(proc, args):
+    """
+    Run one command in the persistent exiftool process; output is raw bytes.
+
+    stay_open mode has no exit status, so a command fails if it reports
+    an error, or if it writes tags but no file was updated or unchanged.
+    """
+    # One argument per line, encoded like argv would be (file names
+    # need not be UTF-8); -echo4 marks the end of stderr output.
+    # Both pipes are always drained up to their sentinels.
+    proc.stdin.write(b"\n".join(os.fsencode(a) for a in args) + b"\n-echo4\n{ready}\n-execute\n")
+    proc.stdin.flush()
+    out = _read_until_ready(proc.stdout)
+    err = _read_until_ready(proc.stderr)
+    failed = any(line.startswith(b"Error") for line in err.splitlines())
+    writes = any(a.startswith("-") and "=" in a for a in args)
+    if writes and not _WRITE_SUMMARY_RE.search(out):
+        failed = True
+    return (1 if failed else 0), out, err
+
+
+def exiftool_run(args, capture_stdout=True, capture_stderr=True):
+    """
+    Run one exiftool command and return (returncode, stdout, stderr).
+
+    Uses the persistent process when it has been started, otherwise
+    spawns a new exiftool for the command. If the persistent process
+    fails, it is replaced and the command is run on its own. Output is
+    decoded once, at the end; a stream that is not captured is returned
+    as None.
+    """
+    # Arguments the argfile would alter or drop must go through argv
+    if _exiftool_proc is None or not all(_argfile_safe(a) for a in args):
+        rc, out, err = _exiftool_run_once(args, capture_stdout, capture_stderr)
+    else:
+        try:
+            rc, out, err = _exiftool_run_persistent(_exiftool_proc, args)
+        except Exception:
+            # Died or out of sync: later commands get a fresh process
+            _exiftool_discard()
+            try:
+                exiftool_start()
+            except Exception:
+                pass
+            rc, out, err = _exiftool_run_once(args, capture_stdout, capture_stderr)
+
+    return (
+        rc,
+        _decode(out) if capture_stdout else None,
+        _decode(err) if capture_stderr else None,
+    )
+
+
 def exiftool_get(file_path, *tags) -> str:
     """Read tags from a file using exiftool."""
     try:
-        cmd = ["exiftool", "-s3"] + list(tags) + [file_path]
-        res = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        return res.stdout.strip()
+        _, out, _ = exiftool_run(["-s3"] + list(tags) + [file_path], capture_stderr=False)
+        return out.strip()
     except Exception:
         return ""
 
 
 def exiftool_write(args):
-    """Run exiftool write commands."""
+    """Run exiftool write commands, discarding their output: (returncode, None, None)."""
+    try:
+        return exiftool_run(args, capture_stdout=False, capture_stderr=False)
+    except Exception:
+        return 1, None, None
+
+
+def exiftool_write_capture(args):
+    """Run exiftool write commands, returning (returncode, stdout, stderr)."""
     try:
-        cmd = ["exiftool"] + args
-        res = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        return res.returncode, res.stdout, res.stderr
+        return exiftool_run(args)
     except Exception as e:
         return 1, "", str(e)
 
 
 # ===== JSON SEARCH (ROBUST) =====
 
-def find_json_for_file(file_path):
+def json_candidates(dirpath, names):
+    """
+    Precompute the normalized forms used for matching a directory's JSON
+    file names.
+
+    Returns (entries, by_base): `entries` maps each JSON path to its
+    (base, base without suffix, stem without suffix) forms, in listing
+    order; `by_base` maps a normalized base to the paths that have it.
+    """
+    prefix = os.path.join(dirpath, "")
+    entries = {}
+    by_base = {}
+    for name in names:
+        path = prefix + name
+        base = name[:-5]
+        base_norm = normalize_str(base)
+        entries[path] = (
+            base_norm,
+            normalize_str(strip_suffix(base)),
+            normalize_str(strip_suffix(os.path.splitext(base)[0])),
+        )
+        by_base.setdefault(base_norm, []).append(path)
+    return entries, by_base
+
+
+def drop_json_candidate(candidates, json_path):
+    """Remove a JSON claimed by a file from json_candidates() output."""
+    entries, by_base = candidates
+    base_norm = entries.pop(json_path)[0]
+    paths = by_base[base_norm]
+    paths.remove(json_path)
+    if not paths:
+        del by_base[base_norm]
+
+
+def find_json_for_file(file_path, candidates=None):
     """
     Find the matching JSON file in the same directory.
 
+    `candidates` comes from json_candidates() for that directory; it is
+    listed from disk when not given.
+
     Supports:
       - name.json (e.g. IMG_1234.json)
       - name.ext.json (e.g. IMG_1234.JPG.json)
       - Matches ignoring suffixes like (1), (2), accents, or case
     """
-    dirpath = os.path.dirname(file_path)
     fname = os.path.basename(file_path)
     fname_noext = os.path.splitext(fname)[0]
     fname_norms = {
@@ -102,56 +359,46 @@ def find_json_for_file(file_path):
         normalize_str(strip_suffix(fname_noext))
     }
 
-    try:
-        candidates = [f for f in os.listdir(dirpath) if f.lower().endswith(".json")]
-    except Exception:
-        return None
+    if candidates is None:
+        dirpath = os.path.dirname(file_path)
+        try:
+            names = [f for f in os.listdir(dirpath) if file_ext(f) == ".json"]
+        except Exception:
+            return None
+        candidates = json_candidates(dirpath, names)
+    entries, by_base = candidates
 
-    # 1) Prefer exact match name.ext.json
-    for cand in candidates:
-        cand_base = cand[:-5]
-        if normalize_str(cand_base) == normalize_str(fname):
-            return os.path.join(dirpath, cand)
-
-    # 2) name.json exact
-    for cand in candidates:
-        cand_base = cand[:-5]
-        if normalize_str(cand_base) == normalize_str(fname_noext):
-            return os.path.join(dirpath, cand)
-
-    # 3) Match ignoring suffixes
-    for cand in candidates:
-        cand_base = cand[:-5]
-        cand_norms = {
-            normalize_str(strip_suffix(cand_base)),
-            normalize_str(strip_suffix(os.path.splitext(cand_base)[0]))
-        }
-        if fname_norms & cand_norms:
-            return os.path.join(dirpath, cand)
-
-    # 4) Partial inclusion fallback
-    for cand in candidates:
-        cand_base = cand[:-5]
-        cand_norm = normalize_str(strip_suffix(cand_base))
-        for fn in fname_norms:
-            if cand_norm in fn or fn in cand_norm:
-                return os.path.join(dirpath, cand)
+    # 1) Prefer exact match name.ext.json, 2) then name.json exact
+    for key in (normalize_str(fname), normalize_str(fname_noext)):
+        paths = by_base.get(key)
+        if paths:
+            return paths[0]
 
-    return None
+    # 3) Match ignoring suffixes, else 4) the first prefix match, in a
+    # single pass. Takeout truncates long JSON names and may append e.g.
+    # ".supplemental-metadata", so one name is a prefix of the other.
+    partial = None
+    for cand_path, (_, cand_stripped, cand_stem) in entries.items():
+        if cand_stripped in fname_norms or cand_stem in fname_norms:
+            return cand_path
+        if partial is None and any(fn.startswith(cand_stripped) or cand_stripped.startswith(fn)
+                                   for fn in fname_norms):
+            partial = cand_path
+
+    return partial
 
 
 # ===== DATE PARSING =====
 
-def parse_json_date(json_path):
-    """Try to extract a datetime object from the JSON timestamp."""
+def _parse_json_timestamp(buf):
+    """Extract the timestamp from a fully parsed JSON sidecar."""
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(buf)
     except Exception:
         return None
 
     ts = None
-    for key in ("contentCreateTime", "photoTakenTime", "creationTime"):
+    for key in _TIMESTAMP_KEYS:
         val = data.get(key)
         if isinstance(val, dict) and val.get("timestamp"):
             try:
@@ -159,6 +406,28 @@ def parse_json_date(json_path):
                 break
             except Exception:
                 ts = None
+    return ts
+
+
+def parse_json_date(json_path):
+    """Try to extract a datetime object from the JSON timestamp."""
+    try:
+        with open(json_path, "rb") as f:
+            buf = f.read()
+    except Exception:
+        return None
+
+    # Scan the raw bytes for the first timestamp key; only parse the
+    # whole JSON when that key is present in an unexpected shape
+    ts = None
+    for key, pattern in _TIMESTAMP_RES:
+        m = pattern.search(buf)
+        if m:
+            ts = int(m.group(1))
+            break
+        if key in buf:
+            ts = _parse_json_timestamp(buf)
+            break
 
     if ts:
         try:
@@ -199,6 +468,12 @@ def format_exif_date(dt):
     """Format a datetime for exiftool (YYYY:MM:DD HH:MM:SS)."""
     if dt is None:
         return None
+    return _format_exif_datetime(dt)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_exif_datetime(dt):
+    """Cached formatting for format_exif_date; bursts often share a timestamp."""
     if dt.tzinfo:
         dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
     return dt.strftime("%Y:%m:%d %H:%M:%S")
@@ -206,35 +481,66 @@ def format_exif_date(dt):
 
 # ===== JSON BACKUP =====
 
-def ensure_and_hide_dir(path: Path):
-    """Create a directory and hide it on macOS if possible."""
-    path.mkdir(mode=0o755, exist_ok=True)
-    try:
-        subprocess.run(["chflags", "hidden", str(path)], check=False)
-    except Exception:
-        pass
+# Hiding folders with chflags is only possible on macOS
+_CAN_CHFLAGS = sys.platform == "darwin" and shutil.which("chflags") is not None
+
+# Backup directories already created (and hidden) by this process
+_ensured_dirs = set()
+
+
+def ensure_and_hide_dir(path):
+    """Create a directory and hide it on macOS if possible, once per process."""
+    if path in _ensured_dirs:
+        return
+    os.makedirs(path, mode=0o755, exist_ok=True)
+    if _CAN_CHFLAGS:
+        try:
+            subprocess.run(["chflags", "hidden", path], stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=False)
+        except Exception:
+            pass
+    _ensured_dirs.add(path)
 
 
 def backup_json(json_path):
     """Move the JSON file to `.json_backup`."""
     try:
-        src = Path(json_path)
-        backup_dir = src.parent / ".json_backup"
+        dirpath, name = os.path.split(json_path)
+        backup_dir = os.path.join(dirpath, BACKUP_DIR_NAME)
         ensure_and_hide_dir(backup_dir)
-        dst = backup_dir / src.name
-
-        if dst.exists():
-            base = src.stem
-            suffix = src.suffix
-            i = 1
-            while True:
-                candidate = backup_dir / f"{base}_{i}{suffix}"
-                if not candidate.exists():
-                    dst = candidate
+        base, suffix = os.path.splitext(name)
+
+        # Reserve a free name atomically (backups run in parallel): hard
+        # link the JSON there, or where links are impossible create an
+        # empty placeholder exclusively and move the JSON over it
+        dst = os.path.join(backup_dir, name)
+        i = 0
+        while True:
+            try:
+                os.link(json_path, dst)
+                linked = True
+                break
+            except FileExistsError:
+                pass
+            except OSError:
+                # No hard links here (other filesystem, FAT, FUSE, SMB...)
+                try:
+                    os.close(os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    linked = False
                     break
-                i += 1
+                except FileExistsError:
+                    pass
+            i += 1
+            dst = os.path.join(backup_dir, f"{base}_{i}{suffix}")
 
-        shutil.move(str(src), str(dst))
+        try:
+            if linked:
+                os.unlink(json_path)
+            else:
+                shutil.move(json_path, dst)
+        except Exception:
+            os.remove(dst)
+            raise
         return True
     except Exception as e:
         print(f"\nWarning: could not move JSON {json_path}: {e}")
@@ -249,33 +555,25 @@ def apply_metadata(file_path, dt):
     if not date_str:
         return False
 
-    ext = file_path.lower()
-    args = ["-overwrite_original", f"-FileModifyDate={date_str}", f"-FileCreateDate={date_str}"]
-
-    if ext.endswith(PHOTO_EXTS):
-        args += [f"-AllDates={date_str}"]
-    elif ext.endswith(VIDEO_EXTS):
-        args += [
-            f"-Keys:CreationDate={date_str}",
-            f"-QuickTime:CreateDate={date_str}",
-            f"-QuickTime:ModifyDate={date_str}"
-        ]
-
+    tags = _EXT_DATE_TAGS.get(file_ext(file_path), _BASE_DATE_TAGS)
+    args = ["-overwrite_original"]
+    args += [tag + date_str for tag in tags]
     args.append(file_path)
     rc, _, _ = exiftool_write(args)
     return rc == 0
 
 
-def process_file(file_path, counters):
+def process_file(file_path, json_path):
     """
     Process a single file:
-      - Find and use associated JSON metadata
+      - Use associated JSON metadata (see find_json_for_file)
       - Move JSON to `.json_backup`
       - If no JSON, try video EXIF date
       - If still missing, use file modification time
-      - Apply metadata and update counters
+      - Apply metadata
+
+    Returns a tuple (updated, used_json, json_moved).
     """
-    json_path = find_json_for_file(file_path)
     used_json = False
     used_json_moved = False
     dt = None
@@ -287,7 +585,7 @@ def process_file(file_path, counters):
         if moved:
             used_json_moved = True
 
-    if dt is None and file_path.lower().endswith(VIDEO_EXTS):
+    if dt is None and file_ext(file_path) in _VIDEO_EXTS_SET:
         dt = get_video_date_from_exif(file_path)
 
     if dt is None:
@@ -298,15 +596,20 @@ def process_file(file_path, counters):
             dt = datetime.datetime.now()
 
     ok = apply_metadata(file_path, dt)
-    if ok:
-        counters["updated"] += 1
-    else:
-        counters["failed"] += 1
+    return ok, used_json, used_json_moved
+
 
-    if used_json:
-        counters["json_found"] += 1
-        if used_json_moved:
-            counters["json_moved"] += 1
+def init_worker():
+    """Start a persistent exiftool in a worker process, stopped on worker exit."""
+    exiftool_start()
+    # atexit handlers do not run in multiprocessing workers. Finalize is
+    # undocumented; it relies on CPython's worker _bootstrap running
+    # multiprocessing finalizers on exit. Without it, only the atexit
+    # hook registered by exiftool_start remains.
+    try:
+        multiprocessing.util.Finalize(None, exiftool_stop, exitpriority=10)
+    except AttributeError:
+        atexit.register(exiftool_stop)
 
 
 # ===== MAIN =====
@@ -316,11 +619,27 @@ def main(root_dir):
         print("Error: 'exiftool' is not installed or not found in PATH.")
         sys.exit(1)
 
+    # Match JSONs here, from the directory listing, so each JSON is claimed
+    # by at most one file before the workers start moving them
     all_files = []
-    for dirpath, _, filenames in os.walk(root_dir):
-        for name in filenames:
-            if name.lower().endswith(ALL_EXTS):
-                all_files.append(os.path.join(dirpath, name))
+    all_jsons = []
+    for dirpath, entries in walk_files(root_dir):
+        json_names = []
+        media_paths = []
+        for entry in entries:
+            ext = file_ext(entry.name)
+            if ext == ".json":
+                json_names.append(entry.name)
+            elif ext in _ALL_EXTS_SET:
+                media_paths.append(entry.path)
+
+        candidates = json_candidates(dirpath, json_names)
+        for file_path in media_paths:
+            json_path = find_json_for_file(file_path, candidates)
+            if json_path:
+                drop_json_candidate(candidates, json_path)
+            all_files.append(file_path)
+            all_jsons.append(json_path)
 
     total = len(all_files)
     if total == 0:
@@ -330,10 +649,18 @@ def main(root_dir):
     counters = {"processed": 0, "updated": 0, "failed": 0, "json_found": 0, "json_moved": 0}
 
     print(f"Processing {total} files...\n")
-    for i, fpath in enumerate(all_files, start=1):
-        print_progress(i, total, os.path.basename(fpath))
-        process_file(fpath, counters)
-        counters["processed"] += 1
+    progress_stride = max(1, total // PROGRESS_UPDATES)
+    with ProcessPoolExecutor(initializer=init_worker) as pool:
+        results = pool.map(process_file, all_files, all_jsons, chunksize=16)
+        for i, (fpath, (ok, used_json, json_moved)) in enumerate(zip(all_files, results), start=1):
+            if i % progress_stride == 0 or i == total:
+                print_progress(i, total, os.path.basename(fpath))
+            counters["processed"] += 1
+            counters["updated" if ok else "failed"] += 1
+            if used_json:
+                counters["json_found"] += 1
+                if json_moved:
+                    counters["json_moved"] += 1
 
     print_progress(total, total, "Done")
     print("\n\n=== Summary ===")